@@ -34,6 +34,22 @@ def get_available_midi_input_devices():
     return enumerate(midi_in.get_ports())
 
 
+@functools.lru_cache(maxsize=1)
+def _midi_input_port_numbers(time_bucket):
+    # time_bucket is only there to expire the cache; see get_recent_midi_input_port_numbers
+    return frozenset(port_number for port_number, _ in get_available_midi_input_devices())
+
+
+def get_recent_midi_input_port_numbers():
+    """
+    Like get_available_midi_input_devices, but returns just the set of port numbers, and only re-probes the devices
+    at most once per second. (Used for validating port numbers without querying rtmidi every time.)
+
+    :return a frozenset of the available port numbers
+    """
+    return _midi_input_port_numbers(int(time.monotonic()))
+
+
 def print_available_midi_input_devices():
     """
     Prints a list of available ports and devices for midi input or output
@@ -90,7 +106,7 @@ def get_port_number_of_midi_device(device_name, input_or_output):
         return None
 
 
-def start_midi_listener(port_number_or_device_name, callback_function, clock):
+def start_midi_listener(port_number_or_device_name, callback_function, clock, enqueue_function=None):
     """
     Start a midi listener on a given port (or for the given device)
 
@@ -101,6 +117,10 @@ def start_midi_listener(port_number_or_device_name, callback_function, clock):
         argument (the midi message) or two arguments (the midi message, and the dt since the last message)
     :param clock: the clock to rouse when this callback operates
     :type clock: Clock
+    :param enqueue_function: if given, incoming messages are not handled on the midi driver's thread. Instead, this
+        function is called with the listener's MidiIn, a message handler and the raw message, and is responsible for
+        calling the handler with the message on some other thread.
+    :type enqueue_function: Callable
     """
 
     port_number = get_port_number_of_midi_device(port_number_or_device_name, "input") \
@@ -108,7 +128,7 @@ def start_midi_listener(port_number_or_device_name, callback_function, clock):
 
     if port_number is None:
         raise ValueError("Could not find matching MIDI device.")
-    elif port_number not in (x[0] for x in get_available_midi_input_devices()):
+    elif port_number not in get_recent_midi_input_port_numbers():
         raise ValueError("Invalid port number for midi listener.")
 
     callback_function_signature = inspect.signature(callback_function)
@@ -124,14 +144,20 @@ def start_midi_listener(port_number_or_device_name, callback_function, clock):
     def callback_wrapper(message, data=None):
         clock.rouse_and_hold()
         threading.current_thread().__clock__ = clock
-        if callback_accepts_dt:
-            callback_function(message[0], message[1])
-        else:
-            callback_function(message[0])
-        threading.current_thread().__clock__ = None
-        clock.release_from_suspension()
-
-    midi_in.set_callback(callback_wrapper)
+        try:
+            if callback_accepts_dt:
+                callback_function(message[0], message[1])
+            else:
+                callback_function(message[0])
+        finally:
+            # make sure the clock is released even if the callback raises, so that it doesn't get stuck in suspension
+            threading.current_thread().__clock__ = None
+            clock.release_from_suspension()
+
+    if enqueue_function is None:
+        midi_in.set_callback(callback_wrapper)
+    else:
+        midi_in.set_callback(lambda message, data=None: enqueue_function(midi_in, callback_wrapper, message))
     return midi_in
 
 
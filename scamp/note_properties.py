@@ -170,6 +170,9 @@ class NoteProperties(SimpleNamespace, SavesToJSON, NoteProperty):
 
     PROPERTY_TYPES_AS_DICT = {property_info["key"]: property_info for property_info in PROPERTY_TYPES}
 
+    # compiled once up front, rather than looked up in re's pattern cache for every key of every NoteProperties
+    _PROPERTY_TYPE_REGEXES = tuple(re.compile(property_info["regex"]) for property_info in PROPERTY_TYPES)
+
     def __init__(self, *args, **kwargs):
         if len(args) > 0:
             arg_properties = NoteProperties.interpret(args)
@@ -179,9 +182,9 @@ class NoteProperties(SimpleNamespace, SavesToJSON, NoteProperty):
                 kwargs["bundles"] = [arg_properties]
 
         normalized_kwargs = {}
-        for property_info in NoteProperties.PROPERTY_TYPES:
+        for property_info, property_regex in zip(NoteProperties.PROPERTY_TYPES, NoteProperties._PROPERTY_TYPE_REGEXES):
             for key in kwargs:
-                if re.match(property_info["regex"], key):
+                if property_regex.match(key):
                     # if there's a match in kwargs
                     value = kwargs[key]
                     if _is_non_str_sequence(property_info["default"]):
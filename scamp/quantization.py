@@ -22,7 +22,7 @@ Module containing classes and functions related to the quantization of performan
 from __future__ import annotations
 from fractions import Fraction
 from .utilities import indigestibility, is_multiple, is_x_pow_of_y, round_to_multiple, sum_nested_list, prime_factor, \
-    SavesToJSON, memoize
+    SavesToJSON, memoize, limit_denominator
 from ._metric_structure import MetricStructure
 from collections import namedtuple
 from .settings import quantization_settings, engraving_settings
@@ -449,7 +449,7 @@ class MeasureQuantizationScheme:
         divisor_factors = sorted(prime_factor(beat_divisor))
 
         # then get the natural divisors of the beat length from big to small
-        natural_factors = sorted(prime_factor(Fraction(beat_length).limit_denominator().numerator), reverse=True)
+        natural_factors = sorted(prime_factor(limit_denominator(beat_length)[0]), reverse=True)
 
         # now for each natural factor
         for natural_factor in natural_factors:
@@ -1014,7 +1014,7 @@ def _construct_quantization_record(beat_divisors, end_beat, quantization_scheme)
                 # in case the subdivision length is 3/16 or something like that, turn it into 1/16. (This can happen
                 # if we're in a compound time signature, dividing 1.5 into 8 or something, and not allowing that to
                 # be expressed as a tuplet.)
-                subdivision_length /= Fraction(subdivision_length).limit_denominator().numerator
+                subdivision_length /= limit_denominator(subdivision_length)[0]
                 # if the subdivision length is a power of 2, make min_duple_subdivision at least that fine
                 if is_x_pow_of_y(subdivision_length, 2) and subdivision_length < min_duple_subdivision:
                     min_duple_subdivision = subdivision_length
@@ -27,7 +27,8 @@ from .settings import quantization_settings, engraving_settings
 from expenvelope import Envelope
 from .quantization import QuantizationRecord, QuantizationScheme, QuantizedMeasure, TimeSignature
 from . import performance as performance_module  # to distinguish it from variables named performance
-from .utilities import prime_factor, floor_x_to_pow_of_y, is_x_pow_of_y, ceil_to_multiple, floor_to_multiple
+from .utilities import prime_factor, floor_x_to_pow_of_y, is_x_pow_of_y, ceil_to_multiple, floor_to_multiple, \
+    limit_denominator
 from ._engraving_translations import length_to_note_type, get_xml_notehead, get_lilypond_notehead_name, \
     articulation_to_xml_element_name, notations_to_xml_notations_element, attach_abjad_notation_to_note, \
     xml_barline_to_lilypond
@@ -35,13 +36,16 @@ from .note_properties import NoteProperties
 from .text import StaffText
 import pymusicxml
 from pymusicxml.score_components import _XMLNote, MusicXMLComponent
+from xml.etree import ElementTree
 from ._dependencies import abjad
 import math
+import functools
+import io
 from fractions import Fraction
 from copy import deepcopy
 from itertools import accumulate, count
 import textwrap
-from collections import namedtuple
+from collections import namedtuple, deque
 from abc import ABC, abstractmethod
 import logging
 from ._metric_structure import MetricStructure
@@ -54,23 +58,47 @@ from clockblocks import TempoEnvelope
 ##################################################################################################################
 
 
-def _is_undotted_length(length):
-    return length in length_to_note_type
+_MUSIC_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD ' \
+                    'MusicXML 3.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n'
+
+
+def _write_music_xml(xml_component: MusicXMLComponent, file, pretty_print: bool) -> None:
+    # Writes the same output as pymusicxml's MusicXMLComponent.to_xml, as UTF-8 bytes, into the binary file given.
+    # Pretty printing is done in place with ElementTree.indent, rather than by re-parsing every element into a
+    # minidom document and stripping the xml declaration from what comes back out. Each element is also serialized
+    # straight into the file, instead of first being joined into one big string.
+    file.write((_MUSIC_XML_HEADER if pretty_print else _MUSIC_XML_HEADER.replace("\n", "")).encode())
+    for element in xml_component.render():
+        if pretty_print:
+            ElementTree.indent(element, space="\t")
+        ElementTree.ElementTree(element).write(file, encoding="utf-8", xml_declaration=False)
+        if pretty_print:
+            file.write(b"\n")
+
+
+def _music_xml_to_string(xml_component: MusicXMLComponent, pretty_print: bool) -> str:
+    with io.BytesIO() as byte_stream:
+        _write_music_xml(xml_component, byte_stream, pretty_print)
+        return byte_stream.getvalue().decode()
+
+
+# maps every dotted or undotted note length to its undotted length and number of dots. (Past 20 dots or so, the
+# denominators get bigger than limit_denominator will ever give us, so there's no point in going further.)
+_length_to_basic_length_and_num_dots = {
+    Fraction(basic_length) * (2 - Fraction(1, 2 ** dots)): (basic_length, dots)
+    for dots in reversed(range(21)) for basic_length in length_to_note_type
+}
 
 
 def _get_basic_length_and_num_dots(length):
     length = Fraction(length).limit_denominator()
-    if _is_undotted_length(length):
-        return length, 0
-    else:
-        dots_multiplier = 1.5
-        dots = 1
-        while not _is_undotted_length(length / dots_multiplier):
-            dots += 1
-            dots_multiplier = (2.0 ** (dots + 1) - 1) / 2.0 ** dots
-            if dots > engraving_settings.max_dots_allowed:
-                raise ValueError("Duration length of {} does not resolve to single note type.".format(length))
-        return length / dots_multiplier, dots
+    try:
+        basic_length, dots = _length_to_basic_length_and_num_dots[length]
+    except KeyError:
+        basic_length = dots = None
+    if dots is None or dots > engraving_settings.max_dots_allowed:
+        raise ValueError("Duration length of {} does not resolve to single note type.".format(length))
+    return basic_length, dots
 
 
 def _is_single_note_length(length):
@@ -102,7 +130,7 @@ def _get_beat_division_hierarchy(beat_length, beat_divisor, small_to_big=True):
     divisor_factors = sorted(prime_factor(beat_divisor), reverse=not small_to_big)
 
     # then get the natural divisors of the beat length from big to small
-    natural_factors = sorted(prime_factor(Fraction(beat_length).limit_denominator().numerator), reverse=True)
+    natural_factors = sorted(prime_factor(limit_denominator(beat_length)[0]), reverse=True)
 
     # now for each natural factor
     for natural_factor in natural_factors:
@@ -161,7 +189,7 @@ def _get_beat_division_grids(beat_hierarchy):
     return out
 
 
-# should maybe memoize?
+@functools.lru_cache()
 def _is_single_note_viable_grouping(length_in_subdivisions, max_dots=1):
     """
     This tests if a note that is length_in_subdivisions subdivisions long can be represented by a single note.
@@ -174,7 +202,7 @@ def _is_single_note_viable_grouping(length_in_subdivisions, max_dots=1):
     """
     dot_multipliers = [2 - 2**(-x) for x in range(max_dots+1)]
     for dot_multiplier in dot_multipliers:
-        if Fraction(math.log2(length_in_subdivisions / dot_multiplier)).limit_denominator().denominator == 1:
+        if limit_denominator(math.log2(length_in_subdivisions / dot_multiplier))[1] == 1:
             return True
     return False
 
@@ -454,6 +482,9 @@ class ScoreComponent(ABC):
     for wrapping any object up as a Score and converting to LilyPond and MusicXML output.
     """
 
+    # empty, so that leaf components like NoteLike can define slots of their own
+    __slots__ = ()
+
     @abstractmethod
     def _to_abjad(self) -> abjad().Component:
         """
@@ -477,7 +508,10 @@ class ScoreComponent(ABC):
         :param file_path: file path to save to
         :param pretty_print: whether or not to take the extra space and format the file with indentations, etc.
         """
-        self.to_music_xml().export_to_file(file_path, pretty_print=pretty_print)
+        # convert before opening the file, so that a failed conversion doesn't wipe out whatever was there
+        xml_score = self.to_music_xml().wrap_as_score()
+        with open(file_path, 'wb') as file:
+            _write_music_xml(xml_score, file, pretty_print)
 
     def print_music_xml(self, pretty_print: bool = True) -> None:
         """
@@ -485,7 +519,7 @@ class ScoreComponent(ABC):
 
         :param pretty_print: whether or not to take the extra space and format the file with indentations, etc.
         """
-        print(self.to_music_xml().to_xml(pretty_print=pretty_print))
+        print(_music_xml_to_string(self.to_music_xml(), pretty_print))
 
     def show_xml(self) -> None:
         """
@@ -1132,18 +1166,23 @@ class Score(ScoreComponent, ScoreContainer):
         return tempo_voice, mark_beats_to_skip_objects
 
     def to_music_xml(self) -> pymusicxml.Score:
-        xml_score = pymusicxml.Score([part.to_music_xml() for part in self. parts], self.title, self.composer)
+        xml_score = pymusicxml.Score([part.to_music_xml() for part in self.parts], self.title, self.composer)
+        # pymusicxml's Score.parts re-expands the part groups every time it's accessed, so only do that once
+        xml_parts = xml_score.parts
 
         if self.final_bar_line is not None:
-            for staff in xml_score.parts:
-                staff.measures[-1].barline = self.final_bar_line
+            for xml_part in xml_parts:
+                xml_part.measures[-1].barline = self.final_bar_line
 
         # go through and add all of the tempo marks to the xml score
         key_points, guide_marks = self._get_tempo_key_points_and_guide_marks()
+        # both of these get consumed from the front as we go, so use deques to make that cheap
+        key_points, guide_marks = deque(key_points), deque(guide_marks)
+        tempo_at = self.tempo_envelope.tempo_at
 
         measure_start = 0  # running counter of the beat at the start of the measure
         # go through each measure and add the tempo annotations
-        for xml_measure, score_measure in zip(xml_score.parts[0].measures, self.staves[0].measures):
+        for xml_measure, score_measure in zip(xml_parts[0].measures, self.staves[0].measures):
             # if there's no more key points or guide marks, we're done
             if len(key_points) + len(guide_marks) == 0:
                 break
@@ -1160,9 +1199,9 @@ class Score(ScoreComponent, ScoreContainer):
 
             # loop through the key points until there are none left or there are none left in this measure
             while len(key_points) > 0 and key_points[0] - measure_start < score_measure.length:
-                key_point = key_points.pop(0)
-                key_point_tempo = self.tempo_envelope.tempo_at(key_point)
-                next_key_point_tempo = self.tempo_envelope.tempo_at(key_points[0], from_left=True) \
+                key_point = key_points.popleft()
+                key_point_tempo = tempo_at(key_point)
+                next_key_point_tempo = tempo_at(key_points[0], from_left=True) \
                     if len(key_points) > 0 else None
                 # figure out whether accel or rit to the next key point, or if none is needed
                 change_indicator = None if next_key_point_tempo is None or next_key_point_tempo == key_point_tempo \
@@ -1182,7 +1221,7 @@ class Score(ScoreComponent, ScoreContainer):
 
             # loop through the guide marks until there are none left or there are none left in this measure
             while len(guide_marks) > 0 and guide_marks[0][0] - measure_start < score_measure.length:
-                guide_mark_location, guide_mark_tempo = guide_marks.pop(0)
+                guide_mark_location, guide_mark_tempo = guide_marks.popleft()
                 # add the guide mark
                 this_measure_annotations.append(
                     (pymusicxml.MetronomeMark(metronome_mark_beat_length,
@@ -1909,7 +1948,7 @@ class Voice(ScoreComponent, ScoreContainer):
         tuplet = Tuplet.from_length_and_divisor(beat_quantization.length, divisor) if divisor is not None else None
         # this line comes into play if we're dividing a 1.5 beat into 8 or something like that
         # instead of dividing by 8, which gives us 3/16, we want to divide by 24 to get 1/16
-        divisor *= Fraction(beat_quantization.length / divisor).limit_denominator().numerator
+        divisor *= limit_denominator(beat_quantization.length / divisor)[0]
 
         dilation_factor = 1 if tuplet is None else tuplet.dilation_factor()
         written_division_length = beat_quantization.length / divisor * dilation_factor
@@ -2318,6 +2357,9 @@ class NoteLike(ScoreComponent):
     :ivar properties: a properties dictionary, same as found in a PerformanceNote
     """
 
+    # a long score holds a great many of these, so skip the per-instance __dict__
+    __slots__ = ("pitch", "volume", "written_length", "properties")
+
     def __init__(self, pitch: Envelope | float | tuple | None, volume: Envelope | float | None,
                  written_length: float, properties: NoteProperties):
 
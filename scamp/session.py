@@ -22,15 +22,83 @@ functionality flows.
 from __future__ import annotations
 from .transcriber import Transcriber
 from ._midi import get_available_midi_input_devices, get_port_number_of_midi_device, \
-    print_available_midi_input_devices, print_available_midi_output_devices, start_midi_listener
+    get_recent_midi_input_port_numbers, print_available_midi_input_devices, print_available_midi_output_devices, \
+    start_midi_listener
 from .instruments import Ensemble, ScampInstrument
-from clockblocks import Clock
+from clockblocks import Clock, DeadClockError
 from .utilities import SavesToJSON
 from ._dependencies import pynput, pythonosc
 from .spelling import SpellingPolicy
 from typing import Iterator, Callable, Sequence
 from .performance import Performance
+from collections import deque, namedtuple
 import threading
+import logging
+import selectors
+import socket
+
+
+# records the Session (if any) to which each listener thread has been bound as its clock
+_bound_clock = threading.local()
+
+# the OSC server on a given (ip_address, port), along with the dispatcher that maps addresses to callbacks
+_OSCListener = namedtuple("_OSCListener", "server dispatcher")
+
+
+class _PromptShutdownMixIn:
+    """
+    Mixin for socketserver servers that makes serve_forever block on the server socket alongside a wake-up socket,
+    rather than polling every poll_interval. shutdown writes to the wake-up socket, so it returns as soon as the
+    serving loop notices, instead of after up to a full poll interval.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._wake_receiver, self._wake_sender = socket.socketpair()
+        # no serving loop is running yet, so until serve_forever starts one there is nothing for shutdown to wait for.
+        # The lock makes sure that shutdown either sees the loop as started, or stops it from ever starting.
+        self._serving_finished = threading.Event()
+        self._serving_finished.set()
+        self._serving_lock = threading.Lock()
+        self._shutdown_requested = False
+        super().__init__(*args, **kwargs)
+
+    def serve_forever(self, poll_interval=None):
+        # poll_interval is accepted for compatibility, but unused, since we never need to wake up to check anything
+        with self._serving_lock:
+            if self._shutdown_requested:
+                return
+            self._serving_finished.clear()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                selector.register(self._wake_receiver, selectors.EVENT_READ)
+                while True:
+                    ready = selector.select()
+                    if any(key.fileobj is self._wake_receiver for key, _ in ready):
+                        break
+                    self._handle_request_noblock()
+                    self.service_actions()
+        finally:
+            self._serving_finished.set()
+
+    def shutdown(self):
+        with self._serving_lock:
+            self._shutdown_requested = True
+            self._wake_sender.send(b"\0")
+        self._serving_finished.wait()
+
+    def server_close(self):
+        super().server_close()
+        self._wake_receiver.close()
+        self._wake_sender.close()
+
+
+if pythonosc is not None:
+    class _OSCServer(_PromptShutdownMixIn, pythonosc.osc_server.ThreadingOSCUDPServer):
+        # Closing the server shouldn't wait on callbacks that are still running (or fail outright, if it's called from
+        # within one of them, as when a callback removes its own listener), so handler threads are never joined.
+        daemon_threads = True
+        block_on_close = False
 
 
 class Session(Clock, Ensemble, Transcriber, SavesToJSON):
@@ -56,19 +124,62 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
                           default_spelling_policy=default_spelling_policy, instruments=instruments)
         Transcriber.__init__(self)
 
-        self._listeners = {"midi": {}, "osc": {}}
+        self._midi_listeners = {}
+        self._osc_listeners = {}
+        self._keyboard_listener = None
+        self._mouse_listener = None
+        self._server_thread = None
+
+        # incoming midi messages are queued up by the midi driver's thread and handled on a separate dispatch thread,
+        # so that slow callback functions don't hold up the driver (which drops messages when its buffer fills)
+        self._midi_messages = deque(maxlen=4096)
+        self._midi_messages_waiting = threading.Event()
+        self._midi_dispatch_thread = None
+        # set by a mouse listener's move events (and upon removal of the listener) to wake its dispatch thread
+        self._mouse_move_pending = None
 
     def run_as_server(self) -> Session:
         """
         Runs this session on a parallel thread so that it can act as a server. This is the approach that should be taken
         if running scamp from an interactive terminal session. Simply type :code:`s = Session().run_as_server()`
 
+        If this session is already running as a server, this does nothing (rather than starting a second server
+        thread). A session that has been stopped with :func:`stop_server` cannot be run as a server again.
+
         :return: self
         """
-        return super(Session, self).run_as_server()
+        if not self.alive:
+            raise DeadClockError("Cannot run as server; this session has been stopped or killed.")
+        if self._server_thread is not None and self._server_thread.is_alive():
+            return self
+
+        def run_server():
+            threading.current_thread().__clock__ = self
+            # wait_forever only returns once the clock has been killed, which is what ends the server thread
+            self.wait_forever()
+
+        self._server_thread = threading.Thread(target=run_server, daemon=True)
+        self._server_thread.start()
+        # don't have the thread that called this recognize the Session as its clock anymore
+        threading.current_thread().__clock__ = None
+        return self
+
+    def stop_server(self) -> None:
+        """
+        Stops a session that was started with :func:`run_as_server`. This kills the session's clock (and any processes
+        forked on it), waking up and ending the server thread. Since the clock can't be brought back to life, the
+        session can't be run as a server again afterwards.
+        """
+        self.kill()
 
     # ----------------------------------- Listeners ----------------------------------
 
+    def _bind_current_thread(self):
+        # Listener callbacks are called from threads dedicated to that listener, so rather than setting and then
+        # clearing __clock__ around every single event, we set it once per thread and leave it in place.
+        threading.current_thread().__clock__ = self
+        _bound_clock.clock = self
+
     @staticmethod
     def get_available_midi_input_devices() -> Iterator[tuple[int, str]]:
         """
@@ -90,6 +201,18 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         """
         return print_available_midi_output_devices()
 
+    @staticmethod
+    def _resolve_input_port(port_number_or_device_name: int | str) -> int:
+        # resolves the port number or device name (fuzzy matching only happens here) to a valid input port number
+        port_number = get_port_number_of_midi_device(port_number_or_device_name, "input") \
+            if isinstance(port_number_or_device_name, str) else port_number_or_device_name
+
+        if port_number is None:
+            raise ValueError("Could not find matching MIDI device.")
+        elif port_number not in get_recent_midi_input_port_numbers():
+            raise ValueError("Invalid port number for midi listener.")
+        return port_number
+
     def register_midi_listener(self, port_number_or_device_name: int | str, callback_function: Callable) -> None:
         """
         Register a callback_function to respond to incoming midi events from port_number_or_device_name
@@ -99,17 +222,37 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         :param callback_function: the callback function used when a new midi event arrives. Should take either one
             argument (the midi message) or two arguments (the midi message, and the dt since the last message)
         """
-        port_number = get_port_number_of_midi_device(port_number_or_device_name, "input") \
-            if isinstance(port_number_or_device_name, str) else port_number_or_device_name
-
-        if port_number is None:
-            raise ValueError("Could not find matching MIDI device.")
-        elif port_number not in (x[0] for x in get_available_midi_input_devices()):
-            raise ValueError("Invalid port number for midi listener.")
-
-        if port_number in self._listeners["midi"]:
-            self.remove_midi_listener(port_number)
-        self._listeners["midi"][port_number] = start_midi_listener(port_number, callback_function, clock=self)
+        port_number = Session._resolve_input_port(port_number_or_device_name)
+
+        if port_number in self._midi_listeners:
+            self._remove_midi_listener_by_port(port_number)
+        if self._midi_dispatch_thread is None:
+            self._midi_dispatch_thread = threading.Thread(target=self._dispatch_midi_messages, daemon=True)
+            self._midi_dispatch_thread.start()
+        self._midi_listeners[port_number] = start_midi_listener(port_number, callback_function, clock=self,
+                                                                   enqueue_function=self._enqueue_midi_message)
+
+    def _enqueue_midi_message(self, midi_in, handler, message):
+        # called on the midi driver's thread, so this should do as little as possible
+        self._midi_messages.append((midi_in, handler, message))
+        self._midi_messages_waiting.set()
+
+    def _dispatch_midi_messages(self):
+        while True:
+            self._midi_messages_waiting.wait()
+            # clear before draining, so that a message arriving mid-drain sets the event again
+            self._midi_messages_waiting.clear()
+            while self._midi_messages:
+                midi_in, handler, message = self._midi_messages.popleft()
+                # skip messages still queued for a listener that has since been removed (or replaced), so that its
+                # callback never fires after remove_midi_listener has returned. (The listeners are copied into a tuple
+                # first, since they may be added or removed on another thread while we look through them.)
+                if midi_in not in tuple(self._midi_listeners.values()):
+                    continue
+                try:
+                    handler(message)
+                except Exception:
+                    logging.exception("Exception raised in midi callback function.")
 
     def remove_midi_listener(self, port_number_or_device_name: int | str) -> None:
         """
@@ -120,10 +263,14 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         """
         port_number = get_port_number_of_midi_device(port_number_or_device_name, "input") \
             if isinstance(port_number_or_device_name, str) else port_number_or_device_name
-        if port_number not in self._listeners["midi"]:
+        if port_number not in self._midi_listeners:
             raise ValueError("No midi listener to remove on port", port_number)
-        self._listeners["midi"][port_number].close_port()
-        del self._listeners["midi"][port_number]
+        self._remove_midi_listener_by_port(port_number)
+
+    def _remove_midi_listener_by_port(self, port_number: int) -> None:
+        # removes the listener on an already-resolved port number, without any device lookup
+        self._midi_listeners[port_number].close_port()
+        del self._midi_listeners[port_number]
 
     def register_osc_listener(self, port: int, osc_address_pattern: str, callback_function: Callable,
                               ip_address: str = "127.0.0.1") -> None:
@@ -139,22 +286,30 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         if pythonosc is None:
             raise ImportError("Package python-osc not found; cannot set up osc listener.")
 
-        def callback_wrapper(*args, **kwargs):
-            self.rouse_and_hold()
-            threading.current_thread().__clock__ = self
-            callback_function(*args, **kwargs)
-            threading.current_thread().__clock__ = None
-            self.release_from_suspension()
+        # bound methods are looked up once here, rather than on every incoming message
+        rouse_and_hold, release_from_suspension = self.rouse_and_hold, self.release_from_suspension
 
-        if (ip_address, port) not in self._listeners["osc"]:
+        def callback_wrapper(address, *args):
+            rouse_and_hold()
+            try:
+                if getattr(_bound_clock, "clock", None) is not self:
+                    self._bind_current_thread()
+                callback_function(address, *args)
+            finally:
+                # release even if the callback raised, so that the session doesn't get stuck in suspension
+                release_from_suspension()
+
+        osc_listener = self._osc_listeners.get((ip_address, port))
+        if osc_listener is None:
             dispatcher = pythonosc.dispatcher.Dispatcher()
-            self._listeners["osc"][(ip_address, port)] = {
-                "server": pythonosc.osc_server.ThreadingOSCUDPServer((ip_address, port), dispatcher),
-                "dispatcher": dispatcher
-            }
-            self.fork_unsynchronized(self._listeners["osc"][(ip_address, port)]["server"].serve_forever, args=(0.001, ))
+            osc_listener = self._osc_listeners[(ip_address, port)] = _OSCListener(
+                _OSCServer((ip_address, port), dispatcher), dispatcher
+            )
+            # the server blocks in its selector until a message arrives, so it runs on a plain daemon thread,
+            # rather than permanently occupying a thread from the clock's pool
+            threading.Thread(target=osc_listener.server.serve_forever, daemon=True).start()
 
-        self._listeners["osc"][(ip_address, port)]["dispatcher"].map(osc_address_pattern, callback_wrapper)
+        osc_listener.dispatcher.map(osc_address_pattern, callback_wrapper)
 
     def remove_osc_listener(self, port: int, ip_address: str = "127.0.0.1") -> None:
         """
@@ -163,9 +318,10 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         :param port: port of the listener to remove
         :param ip_address: ip_address of the listener to remove
         """
-        if (ip_address, port) in self._listeners["osc"]:
-            self._listeners["osc"][(ip_address, port)]["server"].shutdown()
-            del self._listeners["osc"][(ip_address, port)]
+        osc_listener = self._osc_listeners.pop((ip_address, port), None)
+        if osc_listener is not None:
+            osc_listener.server.shutdown()
+            osc_listener.server.server_close()
 
     def register_keyboard_listener(self, on_press: Callable = None, on_release: Callable = None,
                                    suppress: bool = False, **kwargs) -> None:
@@ -181,31 +337,35 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
                               "Install pynput and try again.")
         self.remove_keyboard_listener()  # in case one is already running
 
-        keys_down = []
+        keys_down = set()
         if on_press is not None:
             # if on_press is defined, place a wrapper around it that wakes up the the Session when it's called
             def on_press_wrapper(key_argument):
                 self.rouse_and_hold()
-                threading.current_thread().__clock__ = self
-                name, number = Session._name_and_number_from_key(key_argument)
-                if name not in keys_down:
-                    keys_down.append(name)
-                    on_press(name, number)
-                threading.current_thread().__clock__ = None
-                self.release_from_suspension()
+                try:
+                    if getattr(_bound_clock, "clock", None) is not self:
+                        self._bind_current_thread()
+                    name, number = Session._name_and_number_from_key(key_argument)
+                    if name not in keys_down:
+                        keys_down.add(name)
+                        on_press(name, number)
+                finally:
+                    self.release_from_suspension()
         else:
             on_press_wrapper = None
         if on_release is not None:
             # if on_release is defined, place a wrapper around it that wakes up the the Session when it's called
             def on_release_wrapper(key_argument):
                 self.rouse_and_hold()
-                threading.current_thread().__clock__ = self
-                name, number = Session._name_and_number_from_key(key_argument)
-                if name in keys_down:
-                    keys_down.remove(name)
-                on_release(name, number)
-                threading.current_thread().__clock__ = None
-                self.release_from_suspension()
+                try:
+                    if getattr(_bound_clock, "clock", None) is not self:
+                        self._bind_current_thread()
+                    name, number = Session._name_and_number_from_key(key_argument)
+                    if name in keys_down:
+                        keys_down.remove(name)
+                    on_release(name, number)
+                finally:
+                    self.release_from_suspension()
         else:
             # otherwise, in case we defined on_press, we need to make sure to remove the key from key down anyway
             def on_release_wrapper(key_argument):
@@ -216,15 +376,15 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         listener = pynput.keyboard.Listener(on_press=on_press_wrapper, on_release=on_release_wrapper,
                                             suppress=suppress, **kwargs)
         listener.start()
-        self._listeners["keyboard"] = listener
+        self._keyboard_listener = listener
 
     def remove_keyboard_listener(self) -> None:
         """
         Remove a previously added keyboard listener.
         """
-        if "keyboard" in self._listeners:
-            self._listeners["keyboard"].stop()
-            del self._listeners["keyboard"]
+        if self._keyboard_listener is not None:
+            self._keyboard_listener.stop()
+            self._keyboard_listener = None
 
     # Maps the strange virtual key numbers that pynput spits out (for keys that return a pynput.keyboard.KeyCode) to
     # the standard javascript keycodes. (Without this mapping, the vk numbers for KeyCode keys and for special keys
@@ -244,16 +404,28 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         ']': 221, "'": 222
     }
 
+    # maps each of pynput's special keys (pynput.keyboard.Key) to its (name, number); populated on first use
+    _special_key_names_and_numbers = None
+
     @staticmethod
     def _name_and_number_from_key(key_or_key_code):
         # converts the irritating system within pynput to a simple key name and key number
         if key_or_key_code is None:
             return None, None
 
-        name = key_or_key_code.name if isinstance(key_or_key_code, pynput.keyboard.Key) else key_or_key_code.char
+        if Session._special_key_names_and_numbers is None:
+            Session._special_key_names_and_numbers = {
+                key: Session._name_and_number_from_name_and_vk(key.name, key.value.vk) for key in pynput.keyboard.Key
+            }
+        special_key_name_and_number = Session._special_key_names_and_numbers.get(key_or_key_code)
+        if special_key_name_and_number is not None:
+            return special_key_name_and_number
+        return Session._name_and_number_from_name_and_vk(key_or_key_code.char, key_or_key_code.vk)
+
+    @staticmethod
+    def _name_and_number_from_name_and_vk(name, vk):
         if name is None:
-            return "undefined", key_or_key_code.value.vk if isinstance(key_or_key_code, pynput.keyboard.Key) \
-                else key_or_key_code.vk
+            return "undefined", vk
         searchable_name = name.lower().replace("_r", "")
         if searchable_name in Session._uppers_to_lowers:
             searchable_name = Session._uppers_to_lowers[searchable_name]
@@ -261,10 +433,35 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
             number = Session._name_to_js_key_code[searchable_name]
         else:
             # last resort: use the unreliable vk attribute
-            number = key_or_key_code.value.vk if isinstance(key_or_key_code, pynput.keyboard.Key) \
-                else key_or_key_code.vk
+            number = vk
         return name, number
 
+    # (width, height) of the screen, determined the first time it's needed
+    _screen_size = None
+
+    @classmethod
+    def _get_screen_size(cls):
+        if cls._screen_size is None:
+            try:
+                import tkinter as tk
+            except ImportError:
+                raise ImportError("Cannot use relative coordinates, since the tkinter library is required for"
+                                  "determining the screen size.")
+            root = tk.Tk()
+            cls._screen_size = root.winfo_screenwidth(), root.winfo_screenheight()
+            root.destroy()
+        return cls._screen_size
+
+    @staticmethod
+    def _scale_mouse_coordinates(callback, screen_width, screen_height):
+        # wraps a mouse callback taking (x, y, ...) so that it receives x and y as a proportion of the screen size
+        x_scale, y_scale = 1 / screen_width, 1 / screen_height
+
+        def scaled_callback(x, y, *args):
+            callback(x * x_scale, y * y_scale, *args)
+
+        return scaled_callback
+
     def register_mouse_listener(self, on_move: Callable = None, on_press: Callable = None, on_release: Callable = None,
                                 on_scroll: Callable = None, suppress: bool = False, relative_coordinates: bool = False,
                                 **kwargs) -> None:
@@ -287,36 +484,65 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         self.remove_mouse_listener()  # in case one is already running
 
         if relative_coordinates:
-            try:
-                import tkinter as tk
-            except ImportError:
-                raise ImportError("Cannot use relative coordinates, since the tkinter library is required for"
-                                  "determining the screen size.")
-            root = tk.Tk()
-            x_scale = 1 / root.winfo_screenwidth()
-            y_scale = 1 / root.winfo_screenheight()
-        else:
-            x_scale = y_scale = 1
+            # rather than scaling x and y in each of the wrappers below (and multiplying by 1 in the usual case of
+            # absolute coordinates) the callbacks themselves are wrapped in a scaling function only when needed
+            screen_width, screen_height = Session._get_screen_size()
+            on_move, on_press, on_release, on_scroll = (
+                None if callback is None else Session._scale_mouse_coordinates(callback, screen_width, screen_height)
+                for callback in (on_move, on_press, on_release, on_scroll)
+            )
 
         # on_move and on_scroll are surrounded with a very simple wrapper that rouses the session and defines it as
-        # the current clock on the thread of the callback function
+        # the current clock on the thread of the callback function. Since these can fire at a very high rate, we only
+        # go through the rouse / release process when the session is actually dormant; if it's already awake (e.g.
+        # because a previous move event is still being handled), there's nothing to rouse and no hold to release.
         if on_move is not None:
+            # move events are coalesced: pynput's thread just records the latest position, and a dispatch thread
+            # calls on_move once with whatever the latest position is each time it wakes up
+            latest_position = [None]
+            move_pending = self._mouse_move_pending = threading.Event()
+
             def on_move_wrapper(x, y):
-                self.rouse_and_hold()
-                threading.current_thread().__clock__ = self
-                on_move(x * x_scale, y * y_scale)
-                threading.current_thread().__clock__ = None
-                self.release_from_suspension()
+                latest_position[0] = (x, y)
+                move_pending.set()
+
+            def dispatch_moves():
+                self._bind_current_thread()
+                last_dispatched = None
+                while True:
+                    move_pending.wait()
+                    move_pending.clear()
+                    if not listener.running:
+                        return
+                    position = latest_position[0]
+                    if position is last_dispatched:
+                        continue
+                    last_dispatched = position
+                    roused = self._dormant
+                    if roused:
+                        self.rouse_and_hold()
+                    try:
+                        on_move(*position)
+                    except Exception:
+                        logging.exception("Exception raised in mouse move callback function.")
+                    finally:
+                        if roused:
+                            self.release_from_suspension()
         else:
             on_move_wrapper = None
 
         if on_scroll is not None:
             def on_scroll_wrapper(x, y, dx, dy):
-                self.rouse_and_hold()
-                threading.current_thread().__clock__ = self
-                on_scroll(x * x_scale, y * y_scale, dx, dy)
-                threading.current_thread().__clock__ = None
-                self.release_from_suspension()
+                roused = self._dormant
+                if roused:
+                    self.rouse_and_hold()
+                try:
+                    if getattr(_bound_clock, "clock", None) is not self:
+                        self._bind_current_thread()
+                    on_scroll(x, y, dx, dy)
+                finally:
+                    if roused:
+                        self.release_from_suspension()
         else:
             on_scroll_wrapper = None
 
@@ -326,28 +552,36 @@ class Session(Clock, Ensemble, Transcriber, SavesToJSON):
         if on_press is not None or on_release is not None:
             def on_click_wrapper(x, y, button, pressed):
                 self.rouse_and_hold()
-                threading.current_thread().__clock__ = self
-                if pressed:
-                    on_press(x * x_scale, y * y_scale, button.name)
-                else:
-                    on_release(x * x_scale, y * y_scale, button.name)
-                threading.current_thread().__clock__ = None
-                self.release_from_suspension()
+                try:
+                    if getattr(_bound_clock, "clock", None) is not self:
+                        self._bind_current_thread()
+                    if pressed:
+                        on_press(x, y, button.name)
+                    else:
+                        on_release(x, y, button.name)
+                finally:
+                    self.release_from_suspension()
         else:
             on_click_wrapper = None
 
         listener = pynput.mouse.Listener(on_move=on_move_wrapper, on_click=on_click_wrapper,
                                          on_scroll=on_scroll_wrapper, suppress=suppress, **kwargs)
         listener.start()
-        self._listeners["mouse"] = listener
+        if on_move is not None:
+            threading.Thread(target=dispatch_moves, daemon=True).start()
+        self._mouse_listener = listener
 
     def remove_mouse_listener(self) -> None:
         """
         Remove a previously added mouse listener
         """
-        if "mouse" in self._listeners:
-            self._listeners["mouse"].stop()
-            del self._listeners["mouse"]
+        if self._mouse_listener is not None:
+            self._mouse_listener.stop()
+            self._mouse_listener = None
+            if self._mouse_move_pending is not None:
+                # wake up the move dispatch thread so that it sees the listener has stopped
+                self._mouse_move_pending.set()
+                self._mouse_move_pending = None
 
     # --------------------------------- Transcription Stuff -------------------------------
 
@@ -23,6 +23,7 @@ scamp package. These instances are part of the global scamp namespace, and conta
 #  ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++  #
 from __future__ import annotations
 import os
+import sys
 import shutil
 from types import SimpleNamespace
 from .utilities import resolve_path, SavesToJSON
@@ -271,8 +272,7 @@ class PlaybackSettings(_ScampSettings):
         """
         Prints out a list of all of the named soundfonts and the paths of the soundfont files to which they point.
         """
-        for a, b in self.named_soundfonts.items():
-            print("{}: {}".format(a, b))
+        sys.stdout.write("".join("{}: {}\n".format(a, b) for a, b in self.named_soundfonts.items()))
 
     def set_playback_adjustment(self, note_property: str, adjustment: str | NotePlaybackAdjustment):
         from ._parsing import parse_property_key_and_value, parse_note_playback_adjustment
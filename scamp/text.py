@@ -20,6 +20,16 @@ Module containing utilities for representing text in SCAMP, currently containing
 
 from .utilities import SavesToJSON, NoteProperty
 import pymusicxml
+import re
+
+
+# matching runs of 1, 2 or 3 leading and trailing asterisks or underscores, and the style they each stand for
+_style_marker_regex = re.compile(r"(\*{1,3}|_{1,3})(.*)\1", re.DOTALL)
+_num_style_markers_to_style = {
+    1: {"italic": True},
+    2: {"bold": True},
+    3: {"bold": True, "italic": True},
+}
 
 
 class StaffText(SavesToJSON, NoteProperty):
@@ -57,13 +67,10 @@ class StaffText(SavesToJSON, NoteProperty):
 
         :param string: the text, possible with leading and trailing asterisks/underscores
         """
-        if string.startswith("***") and string.endswith("***") or string.startswith("___") and string.endswith("___"):
-            return cls(string[3:-3], bold=True, italic=True)
-        if string.startswith("**") and string.endswith("**") or string.startswith("__") and string.endswith("__"):
-            return cls(string[2:-2], bold=True)
-        if string.startswith("*") and string.endswith("*") or string.startswith("_") and string.endswith("_"):
-            return cls(string[1:-1], italic=True)
-        return cls(string)
+        match = _style_marker_regex.fullmatch(string)
+        if match is None:
+            return cls(string)
+        return cls(match.group(2), **_num_style_markers_to_style[len(match.group(1))])
 
     def to_pymusicxml(self) -> pymusicxml.TextAnnotation:
         """Converts this to a pymusicxml TextAnnotation object."""
@@ -20,7 +20,7 @@
 from __future__ import annotations
 from .performance import Performance
 from expenvelope import Envelope
-from clockblocks import Clock, TempoEnvelope
+from clockblocks import Clock, TempoEnvelope, TimeStamp
 from .instruments import ScampInstrument
 from typing import Sequence
 
@@ -92,9 +92,15 @@ class Transcriber:
 
         # loop through all the transcriptions in progress
         for performance, clock, clock_start_beat, units in self._transcriptions_in_progress:
+            instrument_parts = performance.get_parts_by_instrument(instrument)
+            if len(instrument_parts) == 0:
+                # this transcription isn't recording this instrument, so don't bother working out the note
+                continue
+            # pick the time stamp conversion for this transcription once, rather than for every time stamp below
+            resolve_time_stamp = Transcriber._get_time_stamp_resolver(units)
             # figure out the start_beat and length relative to this transcription's clock and start beat
-            start_beat_in_clock = Transcriber._resolve_time_stamp(note_info["start_time_stamp"], clock, units)
-            end_beat_in_clock = Transcriber._resolve_time_stamp(note_info["end_time_stamp"], clock, units)
+            start_beat_in_clock = resolve_time_stamp(note_info["start_time_stamp"], clock)
+            end_beat_in_clock = resolve_time_stamp(note_info["end_time_stamp"], clock)
 
             note_start_beat = start_beat_in_clock - clock_start_beat
             note_length = end_beat_in_clock - start_beat_in_clock
@@ -105,7 +111,7 @@ class Transcriber:
                 note_length_sections = []
                 last_split = note_start_beat
                 for split_point in note_info["split_points"]:
-                    split_point_beat = Transcriber._resolve_time_stamp(split_point, clock, units)
+                    split_point_beat = resolve_time_stamp(split_point, clock)
                     note_length_sections.append(split_point_beat - last_split)
                     last_split = split_point_beat
                 if end_beat_in_clock > last_split:
@@ -127,10 +133,8 @@ class Transcriber:
                                 param_change_segment.end_level == param_change_segment.start_level:
                             continue
 
-                        param_start_beat_in_clock = Transcriber._resolve_time_stamp(
-                            param_change_segment.start_time_stamp, clock, units)
-                        param_end_beat_in_clock = Transcriber._resolve_time_stamp(
-                            param_change_segment.end_time_stamp, clock, units)
+                        param_start_beat_in_clock = resolve_time_stamp(param_change_segment.start_time_stamp, clock)
+                        param_end_beat_in_clock = resolve_time_stamp(param_change_segment.end_time_stamp, clock)
 
                         # if there's a gap between the last level we recorded and this segment, we need to fill it with
                         # a flat segment that holds the last level recorded
@@ -179,7 +183,7 @@ class Transcriber:
                     else:
                         extra_parameters[param] = note_info["parameter_start_values"][param]
 
-            for instrument_part in performance.get_parts_by_instrument(instrument):
+            for instrument_part in instrument_parts:
                 # it'd be kind of weird for more than one part to have the same instrument, but if they did,
                 # I suppose that each part should transcribe the note
                 instrument_part.new_note(
@@ -188,9 +192,9 @@ class Transcriber:
                 )
 
     @staticmethod
-    def _resolve_time_stamp(time_stamp, clock, units):
+    def _get_time_stamp_resolver(units):
         assert units in ("beats", "time")
-        return time_stamp.beat_in_clock(clock) if units == "beats" else time_stamp.time_in_clock(clock)
+        return TimeStamp.beat_in_clock if units == "beats" else TimeStamp.time_in_clock
 
     def stop_transcribing(self, which_performance=None, tempo_envelope_tolerance=0.001) -> Performance:
         """
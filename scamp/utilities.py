@@ -187,6 +187,32 @@ def is_multiple(x, y) -> bool:
     return round_to_multiple(x, y) == x
 
 
+def limit_denominator(x, max_denominator: int = 1000000) -> tuple[int, int]:
+    """
+    Returns the same result as Fraction(x).limit_denominator(max_denominator), but as a (numerator, denominator)
+    tuple, and without allocating any intermediate Fraction objects along the way. (This is the same continued
+    fraction algorithm used in the fractions module.)
+    """
+    n, d = x.as_integer_ratio()
+    if d <= max_denominator:
+        return n, d
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    denominator = d
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    k = (max_denominator - q0) // q1
+    # choose whichever of the two bounding convergents is closer to x
+    if 2 * d * (q0 + k * q1) <= denominator:
+        return p1, q1
+    else:
+        return p0 + k * p1, q0 + k * q1
+
+
 def prime_factor(n: int) -> list[int]:
     """
     Returns a list of the prime factors of n.